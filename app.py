@@ -11,15 +11,31 @@ logger = logging.getLogger(__name__)
 
 # Initialize
 st.set_page_config(page_title="NBA Predictions", layout="wide")
-data_manager = DataManager()
+
+@st.cache_resource
+def get_data_manager():
+    # One DataManager (and SQLite connection) per process, not per rerun
+    return DataManager()
+
+data_manager = get_data_manager()
+
+def render_history_table(history):
+    # Histories are capped at a few rows; a static table skips the interactive grid
+    if history.empty:
+        st.write("No historical data available")
+    elif len(history) < 20:
+        st.table(history)
+    else:
+        st.dataframe(history)
 
 # Sidebar
 st.sidebar.title("NBA Predictions")
+today = datetime.now()
 selected_date = st.sidebar.date_input(
     "Select Date",
-    datetime.now(),
-    min_value=datetime.now() - timedelta(days=7),
-    max_value=datetime.now() + timedelta(days=7)
+    today,
+    min_value=today - timedelta(days=7),
+    max_value=today + timedelta(days=7)
 )
 
 # Main content
@@ -34,30 +50,23 @@ if games:
         
         if st.button(f"🏀 Analyze", key=f"analyze_{game['id']}"):
             with st.spinner("Analyzing..."):
+                home_name = game['home_team']['full_name']
+                away_name = game['visitor_team']['full_name']
+
                 # Get team histories
-                home_history = data_manager.get_team_history(
-                    game['home_team']['full_name']
-                )
-                away_history = data_manager.get_team_history(
-                    game['visitor_team']['full_name']
-                )
+                home_history = data_manager.get_team_history(home_name)
+                away_history = data_manager.get_team_history(away_name)
                 
                 # Display analysis
                 st.subheader("Team Analysis")
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.write(f"**{game['home_team']['full_name']}**")
-                    if not home_history.empty:
-                        st.dataframe(home_history)
-                    else:
-                        st.write("No historical data available")
+                    st.write(f"**{home_name}**")
+                    render_history_table(home_history)
                 
                 with col2:
-                    st.write(f"**{game['visitor_team']['full_name']}**")
-                    if not away_history.empty:
-                        st.dataframe(away_history)
-                    else:
-                        st.write("No historical data available")
+                    st.write(f"**{away_name}**")
+                    render_history_table(away_history)
 else:
     st.info("No games found for selected date.")
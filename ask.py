@@ -1,22 +1,19 @@
 # ask.py
 
 import os
+import functools
+import queue
+import threading
 import streamlit as st
 
-# --- Safe import of pyttsx3 for local TTS ---
-try:
-    import pyttsx3
-except ImportError:
-    pyttsx3 = None  # pyttsx3 is not available
-
 
 def is_streamlit_runtime():
     """
     Detect if running in a Streamlit runtime environment.
     """
     try:
-        import streamlit.runtime
-        return True
+        from streamlit import runtime
+        return runtime.exists()
     except ImportError:
         return False
 
@@ -28,7 +25,10 @@ def safe_init_tts():
     if is_streamlit_runtime():
         print("TTS disabled: Running in Streamlit environment.")
         return None
-    if pyttsx3 is None:
+    # Imported here so the app never pays for pyttsx3 unless TTS is actually used
+    try:
+        import pyttsx3
+    except ImportError:
         print("TTS disabled: pyttsx3 not installed.")
         return None
     try:
@@ -38,22 +38,54 @@ def safe_init_tts():
         return None
 
 
-# Initialize TTS engine
-engine = safe_init_tts()
+# Initialize the TTS engine on first use rather than at import time
+@functools.cache
+def _get_engine():
+    return safe_init_tts()
+
+
+# Speech runs on a background thread so runAndWait() doesn't block the UI.
+# The engine is created and used only on that thread, as pyttsx3 requires.
+_tts_queue = queue.Queue()
+_tts_lock = threading.Lock()
+_tts_thread = None
+
+
+def _tts_worker():
+    while True:
+        text = _tts_queue.get()
+        # Never let one failed phrase kill the thread, or every later speak() is lost
+        try:
+            engine = _get_engine()
+            if engine:
+                engine.say(text)
+                engine.runAndWait()
+            else:
+                print(f"[TTS Disabled] {text}")
+        except Exception as e:
+            print(f"TTS error: {e}")
+
+
+def _start_tts_worker():
+    global _tts_thread
+    # Locked so concurrent first calls can't start two workers speaking over each other
+    with _tts_lock:
+        if _tts_thread is None:
+            _tts_thread = threading.Thread(target=_tts_worker, name="tts", daemon=True)
+            _tts_thread.start()
 
 
 def speak(text):
     """
-    Speak the given text if TTS is available; otherwise print it.
+    Queue the given text to be spoken in the background if TTS is available; otherwise print it.
     """
-    if engine:
-        engine.say(text)
-        engine.runAndWait()
-    else:
-        print(f"[TTS Disabled] {text}")
+    _start_tts_worker()
+    _tts_queue.put(text)
 
 
 # --- Omniscient UI Entry Point ---
+# Runs as a fragment so widgets elsewhere in the app don't re-execute it
+@st.fragment
 def ask_omniscience_ui(analyzer=None, sport=None):
     """
     Streamlit UI for the Omniscient 'Ask' tab.
@@ -64,9 +96,12 @@ def ask_omniscience_ui(analyzer=None, sport=None):
     st.title("🔮 Ask the Omniscient")
     st.markdown("Enter a sports-related question, prediction, or hypothesis.")
 
-    user_question = st.text_input("Ask your question:")
+    # A form holds edits client-side, so typing doesn't trigger reruns until Submit
+    with st.form("ask_form", clear_on_submit=False):
+        user_question = st.text_input("Ask your question:")
+        submitted = st.form_submit_button("Submit")
 
-    if st.button("Submit") and user_question:
+    if submitted and user_question:
         if analyzer and hasattr(analyzer, "answer"):
             try:
                 response = analyzer.answer(user_question, sport)
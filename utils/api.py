@@ -1,47 +1,92 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
 from datetime import datetime
 import logging
 
+# orjson is optional; fall back to the stdlib parser when it isn't installed
+try:
+    import orjson as json_lib
+except ImportError:
+    import json as json_lib
+
 logger = logging.getLogger(__name__)
 BASE_URL = "https://www.balldontlie.io/api/v1"
 
-@st.cache_data(ttl=300)
+# Shared session so repeat calls reuse the pooled TLS connection
+@st.cache_resource
+def get_http_session():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False,
+            # A server's Retry-After can be minutes and isn't bounded by timeout=;
+            # don't let it stall the script thread
+            respect_retry_after_header=False
+        )
+    ))
+    return session
+
+def _check_status(response):
+    # Raise inside the cached helpers so error responses aren't memoized as []
+    if response.status_code != 200:
+        raise requests.HTTPError(f"API Error: {response.status_code}", response=response)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_nba_games(formatted_date: str):
+    response = get_http_session().get(
+        f"{BASE_URL}/games",
+        params={"dates[]": formatted_date},
+        timeout=10
+    )
+    _check_status(response)
+    return json_lib.loads(response.content).get("data", [])
+
 def fetch_nba_games(date: datetime):
+    # Failures are handled outside the cached call so an outage isn't memoized for the TTL
     try:
-        formatted_date = date.strftime("%Y-%m-%d")
-        response = requests.get(
-            f"{BASE_URL}/games",
-            params={"dates[]": formatted_date},
-            timeout=10
-        )
-        if response.status_code == 200:
-            return response.json().get("data", [])
-        else:
-            logger.error(f"API Error: {response.status_code}")
-            return []
+        return _fetch_nba_games(date.strftime("%Y-%m-%d"))
+    except requests.HTTPError as e:
+        logger.error(str(e))
+        return []
     except Exception as e:
         logger.error(f"Error fetching games: {e}")
         return []
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_player_stats(player_id=None, player_name=None):
+    if player_name:
+        search_response = get_http_session().get(
+            f"{BASE_URL}/players",
+            params={"search": player_name},
+            timeout=10
+        )
+        _check_status(search_response)
+        players = json_lib.loads(search_response.content).get("data", [])
+        if players:
+            player_id = players[0]["id"]
+        
+    if player_id:
+        response = get_http_session().get(
+            f"{BASE_URL}/stats",
+            params={"player_ids[]": [player_id]},
+            timeout=10
+        )
+        _check_status(response)
+        return json_lib.loads(response.content).get("data", [])
+    return []
+
 def fetch_player_stats(player_id=None, player_name=None):
     try:
-        if player_name:
-            search_response = requests.get(
-                f"{BASE_URL}/players",
-                params={"search": player_name}
-            )
-            players = search_response.json().get("data", [])
-            if players:
-                player_id = players[0]["id"]
-            
-        if player_id:
-            response = requests.get(
-                f"{BASE_URL}/stats",
-                params={"player_ids[]": [player_id]}
-            )
-            return response.json().get("data", [])
+        return _fetch_player_stats(player_id, player_name)
+    except requests.HTTPError as e:
+        logger.error(str(e))
         return []
     except Exception as e:
         logger.error(f"Error fetching player stats: {e}")
@@ -1,21 +1,25 @@
-import pandas as pd
 import sqlite3
 from datetime import datetime
 import os
 import logging
+import threading
+import atexit
 
 logger = logging.getLogger(__name__)
 
 class DataManager:
     def __init__(self):
         self.db_path = 'data/nba_history.db'
+        # One long-lived connection; Streamlit sessions share it, so serialize access
+        self._lock = threading.Lock()
         self._init_db()
 
     def _init_db(self):
         try:
             os.makedirs('data', exist_ok=True)
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            atexit.register(self._conn.close)
+            c = self._conn.cursor()
             
             # Create tables
             c.execute('''
@@ -29,6 +33,16 @@ class DataManager:
                 )
             ''')
             
+            # Covers get_team_history's team filter + ORDER BY date DESC
+            c.execute('''
+                CREATE INDEX IF NOT EXISTS idx_games_home_date
+                ON games(home_team, date DESC)
+            ''')
+            c.execute('''
+                CREATE INDEX IF NOT EXISTS idx_games_away_date
+                ON games(away_team, date DESC)
+            ''')
+            
             c.execute('''
                 CREATE TABLE IF NOT EXISTS predictions (
                     game_id TEXT PRIMARY KEY,
@@ -40,44 +54,55 @@ class DataManager:
                 )
             ''')
             
-            conn.commit()
-            conn.close()
+            self._conn.commit()
+            # WAL persists on the database file and makes commits far cheaper
+            c.execute("PRAGMA journal_mode=WAL")
+            c.execute("PRAGMA synchronous=NORMAL")
         except Exception as e:
             logger.error(f"Database initialization error: {e}")
             raise
 
     def save_game(self, game_data):
+        self.save_games([game_data])
+
+    def save_games(self, games):
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            c.execute('''
-                INSERT OR REPLACE INTO games 
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                game_data['id'],
-                game_data['date'],
-                game_data['home_team'],
-                game_data['away_team'],
-                game_data['home_score'],
-                game_data['away_score']
-            ))
-            conn.commit()
-            conn.close()
+            rows = [(
+                g['id'],
+                g['date'],
+                g['home_team'],
+                g['away_team'],
+                g['home_score'],
+                g['away_score']
+            ) for g in games]
+            # One transaction (and one fsync) for the whole batch
+            with self._lock, self._conn:
+                self._conn.executemany('''
+                    INSERT OR REPLACE INTO games 
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
         except Exception as e:
             logger.error(f"Error saving game: {e}")
 
     def get_team_history(self, team_name, limit=10):
+        # pandas is only needed once a game is analyzed; keep it off the cold-start path
+        import pandas as pd
         try:
-            conn = sqlite3.connect(self.db_path)
             query = '''
-                SELECT * FROM games 
+                SELECT game_id, date, home_team, away_team, home_score, away_score
+                FROM games 
                 WHERE home_team = ? OR away_team = ?
                 ORDER BY date DESC
                 LIMIT ?
             '''
-            df = pd.read_sql_query(query, conn, params=(team_name, team_name, limit))
-            conn.close()
-            return df
+            with self._lock:
+                return pd.read_sql_query(
+                    query, self._conn,
+                    params=(team_name, team_name, limit),
+                    # date is free-form TEXT; parse each row on its own instead of
+                    # inferring one format from the first row and NaT-ing the rest
+                    parse_dates={'date': {'format': 'mixed', 'utc': True, 'errors': 'coerce'}}
+                )
         except Exception as e:
             logger.error(f"Error getting team history: {e}")
             return pd.DataFrame()
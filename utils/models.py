@@ -1,6 +1,8 @@
 from typing import Dict, List
 
 class PlayerProjection:
+    __slots__ = ('name', 'team', 'position', 'stats', 'value_score')
+
     def __init__(self, player_data: Dict):
         self.name = player_data.get('name')
         self.team = player_data.get('team')
@@ -29,30 +31,40 @@ class BettingAnalyzer:
         self.arb_opportunities = []
 
     def analyze_odds(self, markets):
+        # Index the current projections once per call instead of scanning them per market;
+        # setdefault keeps the first projection for a repeated name, like a linear search would
+        by_name = {}
+        for p in self.projections:
+            by_name.setdefault(p.name, p)
         for market in markets:
-            player_proj = next((p for p in self.projections if p.name == market.get('player')), None)
+            player_proj = by_name.get(market.get('player'))
             if not player_proj:
                 continue
-            for book in market.get('markets', []):
-                implied_prob = self._convert_odds(book['odds'])
+            books = market.get('markets', [])
+            if books:
+                # Depends only on the market, so compute it once rather than per book
                 stat_proj = player_proj.stats.get(market['type'], 0) / 100
-                if stat_proj > implied_prob + 0.05:
-                    self.value_plays.append({
-                        'player': player_proj.name,
-                        'prop': market['type'],
-                        'odds': book['odds'],
-                        'edge': round(stat_proj - implied_prob, 3),
-                        'book': book['bookmaker']
-                    })
+                for book in books:
+                    implied_prob = self._convert_odds(book['odds'])
+                    if stat_proj > implied_prob + 0.05:
+                        self.value_plays.append({
+                            'player': player_proj.name,
+                            'prop': market['type'],
+                            'odds': book['odds'],
+                            'edge': round(stat_proj - implied_prob, 3),
+                            'book': book['bookmaker']
+                        })
             self._check_arbitrage(market)
 
     def _check_arbitrage(self, market):
-        odds = [(b['bookmaker'], b['odds']) for b in market.get('markets', []) if 'odds' in b]
-        for i, (book1, odds1) in enumerate(odds):
-            for book2, odds2 in odds[i+1:]:
+        # Convert each book's odds once, not once per pair it appears in
+        odds = [(b['bookmaker'], b['odds'], self._convert_odds(b['odds']))
+                for b in market.get('markets', []) if 'odds' in b]
+        for i, (book1, odds1, p1) in enumerate(odds):
+            for book2, odds2, p2 in odds[i+1:]:
                 if (odds1 > 0 and odds2 < 0) or (odds1 < 0 and odds2 > 0):
-                    arb = self._calculate_arbitrage(odds1, odds2)
-                    if arb > 0:
+                    total = p1 + p2
+                    if total < 1:
                         self.arb_opportunities.append({
                             'player': market['player'],
                             'prop': market['type'],
@@ -60,15 +72,9 @@ class BettingAnalyzer:
                             'book2': book2,
                             'odds1': odds1,
                             'odds2': odds2,
-                            'profit': round(arb * 100, 2)
+                            'profit': round((1 - total) * 100, 2)
                         })
 
     @staticmethod
     def _convert_odds(odds: int) -> float:
         return 100 / (odds + 100) if odds > 0 else abs(odds) / (abs(odds) + 100)
-
-    @staticmethod
-    def _calculate_arbitrage(odds1: int, odds2: int) -> float:
-        p1 = BettingAnalyzer._convert_odds(odds1)
-        p2 = BettingAnalyzer._convert_odds(odds2)
-        return 1 - (p1 + p2) if p1 + p2 < 1 else 0